@@ -10,4 +10,8 @@ class WebserviceConstants(object):
     """The URL endpoint for the FFIEC SOAP-based webservice.
     """
     base_url = "https://cdr.ffiec.gov/Public/PWS/WebServices/RetrievalService.asmx?WSDL"
+    
+    """The URL prefix of the FFIEC webservice host, used to mount a dedicated connection pool.
+    """
+    host_url = "https://cdr.ffiec.gov/"
 
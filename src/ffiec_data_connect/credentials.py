@@ -7,17 +7,127 @@ Credentials may be input via environment variables, or passing them as arguments
 """
 
 import requests
-import sys
 import os
+import functools
+import time
+import random
 
 from enum import Enum
-
-from zeep import Client, Settings
-from zeep.wsse.username import UsernameToken
-from zeep.transports import Transport
+from typing import TYPE_CHECKING
 
 from ffiec_data_connect import constants, ffiec_connection
 
+# zeep is imported where it is used, so that creating credentials does not pay for importing it
+if TYPE_CHECKING:
+    from zeep import Client, Settings
+    from zeep.cache import InMemoryCache
+    from zeep.wsse.username import UsernameToken
+    from zeep.transports import Transport
+
+def _with_backoff(fn, max_retries: int = 3, base: float = 1.0, cap: float = 30.0):
+    """Internal function to call `fn`, retrying transient network failures with exponential backoff.
+    
+    Connection errors, timeouts, and HTTP 5xx responses are retried. Faults returned by the
+    webservice and HTTP 4xx responses (e.g. 401/403 for bad credentials) are raised immediately,
+    since retrying them will not succeed and only adds load to the FFIEC authentication endpoint.
+
+    Args:
+        fn (callable): the function to call, taking no arguments
+        max_retries (int, optional): the maximum number of attempts. Defaults to 3.
+        base (float, optional): the base delay in seconds. Defaults to 1.0.
+        cap (float, optional): the maximum delay in seconds. Defaults to 30.0.
+
+    Returns:
+        any: the return value of `fn`
+    """
+    from zeep.exceptions import TransportError
+    
+    for attempt in range(max_retries):
+        try:
+            return fn()
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, TransportError) as e:
+            
+            # a transport error below 500 is a client-side error, and will fail again on retry
+            if isinstance(e, TransportError) and e.status_code < 500:
+                raise
+            
+            if attempt == max_retries - 1:
+                raise
+            
+            # exponential backoff, with up to 50% jitter
+            time.sleep(min(cap, base * 2 ** attempt * (1 + random.random() * 0.5)))
+
+
+@functools.lru_cache(maxsize=None)
+def _zeep_settings() -> "Settings":
+    """Internal function to return the zeep settings shared by all webservice clients
+    
+    Strict XSD validation of every response element is disabled, and huge XML trees are not allowed.
+
+    Returns:
+        Settings: the shared zeep settings
+    """
+    from zeep import Settings
+    
+    return Settings(strict=False, xml_huge_tree=False)
+
+@functools.lru_cache(maxsize=None)
+def _wsdl_cache() -> "InMemoryCache":
+    """Internal function to return the in-memory cache shared by all zeep transports
+    
+    The WSDL and XSD documents of the FFIEC webservice are downloaded once per process and served from this cache afterwards.
+
+    Returns:
+        InMemoryCache: the shared zeep document cache
+    """
+    from zeep.cache import InMemoryCache
+    
+    return InMemoryCache()
+
+
+# consecutive failed credential checks per username, as (failure count, circuit open until)
+_AUTH_FAILURES = {}
+
+# after this many consecutive failures, credential checks for the username fail fast for the cool-down period
+_AUTH_FAILURE_LIMIT = 5
+_AUTH_COOLDOWN_SECONDS = 60.0
+
+
+def _check_auth_circuit(username: str) -> None:
+    """Internal function to fail fast when a username has recently failed too many credential checks
+    
+    This avoids repeatedly sending bad credentials to the FFIEC authentication endpoint, e.g. from a retry loop in user code.
+
+    Args:
+        username (str): the username being checked
+
+    Raises:
+        ValueError: if the circuit is open for the username
+    """
+    _, open_until = _AUTH_FAILURES.get(username, (0, 0.0))
+    remaining = open_until - time.monotonic()
+    
+    if remaining > 0:
+        raise ValueError("Too many failed credential checks for username {}. Retry after {:.0f} seconds.".format(username, remaining))
+    
+    return
+
+def _record_auth_failure(username: str) -> None:
+    """Internal function to count a failed credential check, opening the circuit when the limit is reached
+
+    Args:
+        username (str): the username that failed the check
+    """
+    failures = _AUTH_FAILURES.get(username, (0, 0.0))[0] + 1
+    
+    if failures >= _AUTH_FAILURE_LIMIT:
+        _AUTH_FAILURES[username] = (0, time.monotonic() + _AUTH_COOLDOWN_SECONDS)
+    else:
+        _AUTH_FAILURES[username] = (failures, 0.0)
+    
+    return
+
+
 class CredentialType(Enum):
     """Enumerated values that represent the methods through which credentials are provided to the FFIEC webservice via the package.
 
@@ -35,17 +145,30 @@ class WebserviceCredentials(object):
         username (str, optional): FFIEC Webservice username. Optional: If not provided, the credentials will be set from the environment variable `FFIEC_USERNAME`
         password (str, optional): FFIEC Webservice password. Optional: If not provided, the credentials will be set from the environment variable `FFIEC_PASSWORD`
     
+    Attributes:
+        username (str): the username stored in the WebserviceCredentials instance
+        password (str): the password stored in the WebserviceCredentials instance
+        credential_source (CredentialType): how the credentials were provided
+    
     Returns:
         WebserviceCredentials: An instance of the WebserviceCredentials class.
     
     """
+
+    __slots__ = ("username", "password", "credential_source", "_wsse")
+    
+    # string representation for each credential source, and whether it includes the username
+    _STR_TEMPLATES = {
+        None: ("No credentials set", False),
+        CredentialType.NO_CREDENTIALS: ("No credentials set", False),
+        CredentialType.SET_FROM_INIT: ("Credentials set from class initialization with username: {}", True),
+        CredentialType.SET_FROM_ENV: ("Credentials set from environment variables with username: {}", True),
+    }
     
     def __init__(self, username = None, password = None):
 
-        # collect the credentials from the environment variables
-        # if the environment variables are not set, we will set the credentials from the arguments
-        username_env = os.getenv("FFIEC_USERNAME")
-        password_env = os.getenv("FFIEC_PASSWORD")
+        # the zeep token is built on first use, see _get_wsse
+        self._wsse = None
 
         # if we are passing in credentials, use them
         if password and username:
@@ -55,35 +178,69 @@ class WebserviceCredentials(object):
             return
         
         # if not, check if we have the two environment variables
+        # (the environment is only read when the credentials were not passed in)
+        username_env = os.environ.get("FFIEC_USERNAME")
+        password_env = os.environ.get("FFIEC_PASSWORD")
         
         # do we have both environment variables?
-        elif username_env and password_env:
+        if username_env and password_env:
             self.username = username_env
             self.password = password_env
             self.credential_source: CredentialType = CredentialType.SET_FROM_ENV
+            return
         
-        else:
-            # do we have a username and password?
-            self.credential_source = CredentialType.NO_CREDENTIALS
+        # we do not have a username and password
+        self.credential_source = CredentialType.NO_CREDENTIALS
 
-            raise ValueError("Username and password must be set to create a connection")
-        
-        return
+        raise ValueError("Username and password must be set to create a connection")
     
         
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def from_env(cls) -> "WebserviceCredentials":
+        """Returns a WebserviceCredentials instance created from the `FFIEC_USERNAME` and `FFIEC_PASSWORD` environment variables.
+        
+        The instance is created once and shared for the rest of the process, so worker code may call
+        this method per task without reading the environment again.
+        
+            | Note: Every caller receives the same instance. Do not assign its `username` or `password`,
+            | since the change would be seen by every other caller; create a new `WebserviceCredentials`
+            | instance for different credentials instead.
+            
+            | Note: To pick up changed environment variables (e.g. in tests), call
+            | `WebserviceCredentials.from_env.cache_clear()`, after which a new instance is created
+        
+        Returns:
+            WebserviceCredentials: the shared instance
+        
+        Raises:
+            ValueError: if the environment variables are not set
+        """
+        return cls()
+    
     def __str__(self) -> str:
         """String representation of the credentials."""
-        if self.credential_source  == CredentialType.NO_CREDENTIALS or self.credential_source == None:
-            return "No credentials set"
-        elif self.credential_source == CredentialType.SET_FROM_INIT:
-            return f"Credentials set from class initialization with username: {self.username}"         
-        elif self.credential_source == CredentialType.SET_FROM_ENV:
-            return f"Credentials set from environment variables with username: {self.username}"            
-        else:
-            return "Unknown credential source"
+        template, has_username = self._STR_TEMPLATES.get(self.credential_source, ("Unknown credential source", False))
+        
+        return template.format(self.username) if has_username else template
     
     def __repr__(self) -> str:
         return self.__str__()
+    
+    def __eq__(self, other) -> bool:
+        """Two WebserviceCredentials instances are equal if they hold the same username and password."""
+        if not isinstance(other, WebserviceCredentials):
+            return NotImplemented
+        
+        return self.username == other.username and self.password == other.password
+    
+    def __hash__(self) -> int:
+        """Hash over the username and password, so that equal credentials are deduplicated in sets.
+        
+        The hash follows the assignable username and password, so the zeep client cache in `get_client`
+        is keyed on a (username, password) snapshot rather than on the instance itself.
+        """
+        return hash((self.username, self.password))
 
         
     def test_credentials(self, session: requests.Session) -> bool:
@@ -97,13 +254,17 @@ class WebserviceCredentials(object):
             session (requests.Session): the connection to test the credentials 
         
         Returns:
-            bool: True if the credentials are valid, False otherwise
+            bool: True if the credentials are valid, False otherwise. A True result means the session
+            and credentials may be reused for subsequent calls without testing them again.
             
         Raises:
-            ValueError: if the credentials are not set
+            ValueError: if the credentials are not set, or have failed too many consecutive checks
+            requests.exceptions.ConnectionError: if the webservice cannot be reached after retrying
+            zeep.exceptions.TransportError: if the webservice returns a server error (5xx) after retrying
             Exception: Other unspecified errors
             
         """
+        from zeep.exceptions import Fault, TransportError
     
         # check that we have a user name
         if self.username is None:
@@ -113,84 +274,123 @@ class WebserviceCredentials(object):
         if self.password is None:
             raise ValueError("Password must be set")
         
+        # fail fast if these credentials have been rejected too many times in a row
+        _check_auth_circuit(self.username)
+        
         # we have a user name and password, so try to log in
-        # create the token
-        wsse = UsernameToken(self.username, self.password)
-
         try:
 
-            # create a transport
-            transport = None
-            
-            if isinstance(session, requests.Session):
-                transport = Transport(session=session)                
-            elif isinstance(session, ffiec_connection.FFIECConnection):
-                transport = Transport(session=session.session)
-            
-            # create the client
-            soap_client = Client(constants.WebserviceConstants.base_url, wsse=wsse, transport=transport)
+            # get the client, which is shared with the methods module
+            soap_client = self.get_client(session)
             
             print("Standby...testing your access.")    
             
-            has_access_response = soap_client.service.TestUserAccess()
+            has_access_response = _with_backoff(lambda: soap_client.service.TestUserAccess())
             
             if has_access_response:
+                _AUTH_FAILURES.pop(self.username, None)
                 print("Your credentials are valid.")
-                return
+                return True
             else:
+                _record_auth_failure(self.username)
                 print("Your credentials are invalid. Please refer to the documentation for more information.")
                 print(has_access_response)
-                return
-                
-            print(has_access_response)
+                return False
                 
-                        
         except Exception as e:
+            # the webservice could not be reached, or kept failing on the server side after retrying,
+            # which says nothing about the credentials
+            if isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)) or (isinstance(e, TransportError) and e.status_code >= 500):
+                print("Unable to reach the FFIEC Webservice: {}".format(e))
+                
+                raise
+            
+            # a fault or 4xx response means the webservice rejected the credentials
+            if isinstance(e, Fault) or isinstance(e, TransportError):
+                _record_auth_failure(self.username)
+            
             print(
                 "Credentials are invalid. Please check documentation for more information."
             )
             print("Credentials error: {}".format(e))
             
             raise(Exception("Credentials are invalid. Please check documentation for more information."))
+
+
+    def get_client(self, session: requests.Session) -> "Client":
+        """Returns the zeep client used to call the FFIEC Webservice with these credentials and session.
         
+        One client is created per combination of session and username/password, and is reused by
+        `test_credentials` and by every function in the `methods` module, so the WSDL of the
+        webservice is parsed once rather than on every call.
         
-    
-    @property
-    def username(self) -> str:
-        """Returns the username from the WebserviceCredentials instance.
+        The clients are stored on the session itself, so they are released together with the session.
+        Sessions are not shared between `FFIECConnection` objects (only their connection pool is), so
+        the clients of one connection are not kept alive by another.
         
-        Returns:
-            str: the username stored in the WebserviceCredentials instance
-        """
-        return self._username
-
-    @username.setter
-    def username(self, username: str) -> None:
-        """Sets the username in the WebserviceCredentials instance.
+            | Note: The session argument can be generated directly from requests, or
+            | using the helper class `FFIECConnection`
         
         Args:
-            username (str): the username to set in the WebserviceCredentials instance
+            session (requests.Session): the connection to use for the client
+        
+        Returns:
+            Client: the zeep client
         """
- 
-        self._username = username
-        pass
+        from zeep import Client
+        
+        # unwrap the requests.Session from an FFIECConnection if needed
+        real_session = session.session if hasattr(session, "session") else session
+        
+        # each client holds a reference to its session through the transport, so the clients are kept on the session
+        # rather than in a module-level cache, which would keep every session (and its client) alive for the whole process
+        clients = getattr(real_session, "_ffiec_clients", None)
+        if clients is None:
+            clients = {}
+            real_session._ffiec_clients = clients
+        
+        # key on a snapshot of the username and password, which stays valid if the instance is changed later
+        key = (self.username, self.password)
+        soap_client = clients.get(key)
+        
+        if soap_client is None:
+            soap_client = Client(constants.WebserviceConstants.base_url, wsse=self._get_wsse(), transport=self._get_transport(real_session), settings=_zeep_settings())
+            clients[key] = soap_client
+        
+        return soap_client
     
-    @property
-    def password(self) -> str:
-        """Returns the password from the WebserviceCredentials instance.
+    def _get_wsse(self) -> "UsernameToken":
+        """Internal method to return the WSSE username token for these credentials
+        
+        The token is created once and reused, and is rebuilt if the username or password has changed since.
         
         Returns:
-            str: the password stored in the WebserviceCredentials instance
+            UsernameToken: the zeep WSSE username token
         """
-        return self._password
-    
+        from zeep.wsse.username import UsernameToken
+        
+        wsse = self._wsse
+        
+        if wsse is None or wsse.username != self.username or wsse.password != self.password:
+            wsse = UsernameToken(self.username, self.password)
+            self._wsse = wsse
+        
+        return wsse
     
-    @password.setter
-    def password(self, password: str) -> None:
-        """Sets the password in the WebserviceCredentials instance.
+    def _get_transport(self, session: requests.Session) -> "Transport":
+        """Internal method to return the zeep transport wrapping a requests session
+        
+        A transport is only needed when a client is created, and the client is cached by `get_client`,
+        so the transport is not cached separately.
         
         Args:
-            password (str): the password to set in the WebserviceCredentials instance
+            session (requests.Session): the session to wrap
+        
+        Returns:
+            Transport: the zeep transport
         """
-        self._password = password
-        pass
+        from zeep.transports import Transport
+        
+        ffiec_connection._mount_ffiec_adapter(session)
+        
+        return Transport(session=session, cache=_wsdl_cache())
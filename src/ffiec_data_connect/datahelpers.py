@@ -2,7 +2,47 @@
 """
 
 
-from zeep import helpers
+def _str(value) -> str:
+    """Converts a value to a string"""
+    return str(value)
+
+def _nonzero_str(value) -> str:
+    """Converts a value to a string, or None if the value is 0"""
+    return str(value) if value != 0 else None
+
+def _stripped(value) -> str:
+    """Strips leading and trailing whitespace from a string"""
+    return value.strip()
+
+def _zip5(value) -> str:
+    """Converts a zip code to a string, left-padded with zeros to 5 digits"""
+    return str(value).zfill(5)
+
+def _bool_or_none(value) -> bool:
+    """Returns the value if it is a bool, otherwise None"""
+    # True and False are singletons, so identity checks avoid a type() call and comparison
+    return value if value is True or value is False else None
+
+
+# (webservice field name, output field name, conversion) for each field of the reporter panel
+_PANEL_FIELDS = (
+    ("ID_RSSD", "id_rssd", _str),
+    ("FDICCertNumber", "fdic_cert_number", _nonzero_str),
+    ("OCCChartNumber", "occ_chart_number", _nonzero_str),
+    ("OTSDockNumber", "ots_dock_number", _nonzero_str),
+    ("PrimaryABARoutNumber", "primary_aba_rout_number", _nonzero_str),
+    ("Name", "name", _stripped),
+    ("State", "state", _stripped),
+    ("City", "city", _stripped),
+    ("Address", "address", _stripped),
+    ("Zip", "zip", _zip5),
+    ("FilingType", "filing_type", _stripped),
+    ("HasFiledForReportingPeriod", "has_filed_for_reporting_period", _bool_or_none),
+)
+
+# the output field names of the reporter panel, in column order
+_REPORTER_PANEL_COLUMNS = tuple(new_field for _, new_field, _ in _PANEL_FIELDS)
+
 
 def _normalize_output_from_reporter_panel(row: dict) -> dict:
 
@@ -10,123 +50,34 @@ def _normalize_output_from_reporter_panel(row: dict) -> dict:
     Converts integers to strings,
     for zipcode, convert to string and zfill for 5 digits
     change hasFiledForReportingPeriod to bool,
-    and change all field names to camel case
+    and change all field names to snake case
+
+    Fields missing from the row are set to None.
+
+    Args:
+        row (dict): a row of the reporter panel, as returned by the webservice
 
     Returns:
-        _type_: _description_
+        dict: the normalized row
     """
 
+    return dict(zip(_REPORTER_PANEL_COLUMNS, _normalize_output_from_reporter_panel_tuple(row)))
+
+
+def _normalize_output_from_reporter_panel_tuple(row: dict) -> tuple:
+
+    """Normalize the output from the reporter panel into a tuple,
+    with the same conversions as `_normalize_output_from_reporter_panel`
 
+    The values are in the order of `_REPORTER_PANEL_COLUMNS`, so that the rows
+    may be passed directly to `pandas.DataFrame.from_records`.
+
+    Args:
+        row (dict): a row of the reporter panel, as returned by the webservice
+
+    Returns:
+        tuple: the normalized row
+    """
 
-    new_row = {}
-    row_keys = list(helpers.serialize_object(row).keys())
-    
-    # process ID_RSSD
-    if 'ID_RSSD' in row_keys:
-        new_row['id_rssd'] = str(row['ID_RSSD'])
-    else:
-        new_row['id_rssd'] = None
-
-    # process FDIC CERT NUMBER
-    if 'FDICCertNumber' in row_keys:
-        if row['FDICCertNumber'] != 0:
-            new_row['fdic_cert_number'] = str(row['FDICCertNumber'])
-        else:
-            new_row['fdic_cert_number'] = None
-    else:
-        new_row["fdic_cert_number" ] = None
-        
-    # OCC chart number
-    if 'OCCChartNumber' in row_keys:
-        if row['OCCChartNumber'] != 0:
-            new_row['occ_chart_number'] = str(row['OCCChartNumber'])
-        else:
-            new_row['occ_chart_number'] = None
-    else: 
-        new_row['occ_chart_number'] = None
-        
-    # process OTSDockNumber
-    if 'OTSDockNumber' in row_keys:
-        if row['OTSDockNumber'] != 0:
-            new_row['ots_dock_number'] = str(row['OTSDockNumber'])
-        else:
-            new_row['ots_dock_number'] = None
-    else:
-        new_row['ots_dock_number'] = None
-        
-    # process PrimaryABARoutNumber
-    if 'PrimaryABARoutNumber' in row_keys:
-        if row['PrimaryABARoutNumber'] != 0:
-            new_row['primary_aba_rout_number'] = str(row['PrimaryABARoutNumber'])
-        else:
-            new_row['primary_aba_rout_number'] = None
-    
-    # Process Name
-    if 'Name' in row_keys:
-        temp_str = row['Name'].strip()
-        if temp_str == '0' or temp_str == '':
-            new_row['name'] = temp_str
-        else:
-            new_row['name'] = temp_str
-       
-    else:
-        new_row['name'] = None
-    
-    #Process State
-    if 'State' in row_keys:
-        temp_str = row['State'].strip()
-        if temp_str == '0' or temp_str == '':
-            new_row['state'] = temp_str
-        else:
-            new_row['state'] = temp_str
-    else:
-        new_row['city'] = None
-    
-    # Process City
-    if 'City' in row_keys:
-        temp_str = row['City'].strip()
-        if temp_str == '0' or temp_str == '':
-            new_row['city'] = temp_str
-        else:
-            new_row['city'] = temp_str        
-    else:
-        new_row['city'] = None
-
-    
-    # Process Address
-    if 'Address' in row_keys:
-        temp_str = row['Address'].strip()
-        if temp_str == '0' or temp_str == '':
-            new_row['address'] = temp_str
-        else:
-            new_row['address'] = temp_str
-            
-
-    #Process Zip
-    if 'Zip' in row_keys:
-        temp_str = str(row['Zip']).zfill(5)
-        if temp_str == '0' or temp_str == '':
-            new_row['zip'] = temp_str
-        else:
-            new_row['zip'] = temp_str
-            
-    
-    #Process FilingType
-    if 'FilingType' in row_keys:
-        temp_str = row['FilingType'].strip()
-        if temp_str == '0' or temp_str == '':
-            new_row['filing_type'] = temp_str
-        else:
-            new_row['filing_type'] = temp_str
-            
-    # process HasFiledForReportingPeriod
-    if 'HasFiledForReportingPeriod' in row_keys:
-        if type(row['HasFiledForReportingPeriod']) == bool:
-            new_row['has_filed_for_reporting_period'] = row['HasFiledForReportingPeriod']
-        else:
-            new_row['has_filed_for_reporting_period'] = None
-            
-
-    return new_row
-    
-    
\ No newline at end of file
+    # zeep rows support `in` and indexing directly, so the row does not need to be serialized first
+    return tuple(convert(row[field]) if field in row else None for field, _, convert in _PANEL_FIELDS)
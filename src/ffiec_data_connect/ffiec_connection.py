@@ -4,7 +4,11 @@
 """
 
 import requests
+import threading
 from enum import Enum
+from urllib.parse import quote
+
+from ffiec_data_connect import constants
 
 
 class ProxyProtocol(Enum):
@@ -17,10 +21,79 @@ class ProxyProtocol(Enum):
     HTTP = 0
     HTTPS = 1
 
+
+# the requests proxies key for each protocol, looked up once per session instead of reading the member name
+_PROXY_SCHEMES = {ProxyProtocol.HTTP: "http", ProxyProtocol.HTTPS: "https"}
+
+# the connection pool for the FFIEC host shared by every session, created by _get_ffiec_adapter
+_FFIEC_ADAPTER = None
+_FFIEC_ADAPTER_LOCK = threading.Lock()
+
+
+def _get_ffiec_adapter() -> requests.adapters.HTTPAdapter:
+    """Internal function to return the connection pool for the FFIEC webservice host shared by all sessions
+    
+    Only the adapter is shared, not the session, so each session keeps its own headers, cookies, and
+    cached zeep clients, while short-lived sessions still reuse open keep-alive connections instead of
+    each paying for a new TCP and TLS handshake.
+    
+    This is the only place where the size of the FFIEC connection pool is set.
+
+    Returns:
+        requests.adapters.HTTPAdapter: the shared adapter
+    """
+    global _FFIEC_ADAPTER
+    
+    if _FFIEC_ADAPTER is None:
+        with _FFIEC_ADAPTER_LOCK:
+            if _FFIEC_ADAPTER is None:
+                # the pool may be used by many threads at once through different sessions, so keep enough idle connections for them
+                _FFIEC_ADAPTER = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=32)
+    
+    return _FFIEC_ADAPTER
+
+
+def _mount_ffiec_adapter(session: requests.Session) -> None:
+    """Internal function to mount the shared keep-alive connection pool for the FFIEC webservice host on a session
+    
+    Repeated SOAP calls through the session then reuse open TLS connections to the webservice.
+    If the session already has an adapter for the FFIEC host (mounted here, or by the caller), it is left in place.
+
+    Args:
+        session (requests.Session): the session on which to mount the adapter
+    """
+    if constants.WebserviceConstants.host_url in session.adapters:
+        return
+    
+    session.mount(constants.WebserviceConstants.host_url, _get_ffiec_adapter())
+    
+    return
+
+
+def _check_proxy_settings(host: str, port: int, protocol: ProxyProtocol) -> None:
+    """Internal function to check that the settings required to use a proxy server are present
+    
+    Args:
+        host (str): the host name of the proxy server
+        port (int): the port of the proxy server
+        protocol (ProxyProtocol): the protocol of the proxy server
+    
+    Raises:
+        ValueError: if the proxy host, port, or protocol is not set
+    """
+    missing = ", ".join(name for name, value in (("proxy_host", host), ("proxy_port", port), ("proxy_protocol", protocol)) if value is None)
+    if missing:
+        raise ValueError(f"Proxy host, port, and protocol must be set before using the proxy. Missing: {missing}")
+    
+    return
+
+
 class FFIECConnection(object):
     """Creates a FFIECConnection object, which may include proxy server connection parameters
     """
     
+    __slots__ = ("_use_proxy", "_proxy_host", "_proxy_port", "_proxy_protocol", "_proxy_user_name", "_proxy_password", "_session", "_session_dirty", "_repr_cache")
+    
     def __init__(self) -> None:
         """Initializes the Https Connection to be utilized
         to connect to the FFIEC website
@@ -31,12 +104,14 @@ class FFIECConnection(object):
         
         """
         
-        self.use_proxy = False
-        self.proxy_host = None
-        self.proxy_port = None
-        self.proxy_password = None
-        self.proxy_user_name = None
-        self.proxy_protocol = None
+        # assign the backing fields directly, so that the session is generated exactly once
+        self._use_proxy = False
+        self._proxy_host = None
+        self._proxy_port = None
+        self._proxy_password = None
+        self._proxy_user_name = None
+        self._proxy_protocol = None
+        self._repr_cache = None
         
         self._generate_session()
         
@@ -47,12 +122,19 @@ class FFIECConnection(object):
         """Returns the requests.Session object
         * Note that this property may be utilized for methods in the `methods` module.
         
-        `This session property is automatically generated when the FFIECConnection object is created.`
+        `This session property is automatically generated when the FFIECConnection object is created,
+        and regenerated on first access after a proxy setting has changed.`
+        
+        `Each FFIECConnection object has its own session, but all sessions share one pool of connections to the FFIEC webservice.`
         
         Returns:
             requests.Session: the requests.Session object
         
         """
+        # proxy setters only mark the session as out of date, so that setting several of them builds one session
+        if self._session_dirty:
+            self._generate_session()
+        
         return self._session
     
     @session.setter
@@ -63,6 +145,10 @@ class FFIECConnection(object):
             session (requests.Session): the requests.Session object
         """
         self._session = session
+        self._session_dirty = False
+        
+        # the string representation shows whether the session is active, so it is rebuilt on next use
+        self._repr_cache = None
         return
         
     @property
@@ -83,9 +169,8 @@ class FFIECConnection(object):
             host (str): the host name of the proxy server
         """
         
-        self._generate_session()
-        
         self._proxy_host = host
+        self._invalidate()
         pass
     
     @property
@@ -105,9 +190,8 @@ class FFIECConnection(object):
         Args:
             protocol (str): the protocol of the proxy server
         """
-        self._generate_session()
-        
         self._proxy_protocol = protocol
+        self._invalidate()
         pass
     
     @property
@@ -127,9 +211,8 @@ class FFIECConnection(object):
             port (int): the port of the proxy server
         """
         
-        self._generate_session()
-        
         self._proxy_port = port
+        self._invalidate()
         pass
     
     @property
@@ -140,9 +223,6 @@ class FFIECConnection(object):
             str: the proxy username
         
         """
-        
-        self._generate_session()
-        
         return self._proxy_user_name
     
     @proxy_user_name.setter
@@ -153,9 +233,8 @@ class FFIECConnection(object):
             username (str): the username of the proxy server
         """
         
-        self._generate_session()
-        
         self._proxy_user_name = username
+        self._invalidate()
         pass
     
     @property
@@ -176,9 +255,8 @@ class FFIECConnection(object):
             password (str): the password of the proxy server
         """
         
-        self._generate_session()
-        
         self._proxy_password = password
+        self._invalidate()
         pass
     
     @property
@@ -213,33 +291,85 @@ class FFIECConnection(object):
         #     self._generate_session()
 
         self._use_proxy = use_proxy_opt
-        
+        self._invalidate()
+
+        return
+
+    def configure_proxy(self, host: str, port: int, protocol: ProxyProtocol, username: str = None, password: str = None, enable: bool = True) -> None:
+        """Set all of the proxy settings at once
+
+        This is the preferred way to configure a proxy server: the session is rebuilt
+        once for the new settings, rather than after each individual property is set.
+
+        Args:
+            host (str): the host name of the proxy server
+            port (int): the port of the proxy server
+            protocol (ProxyProtocol): the protocol of the proxy server
+            username (str, optional): the username of the proxy server. Defaults to None.
+            password (str, optional): the password of the proxy server. Defaults to None.
+            enable (bool, optional): the flag to use the proxy server. Defaults to True.
+
+        Raises:
+            ValueError: if the proxy is enabled, but the proxy host, port, or protocol is not set.
+                The existing proxy settings are left unchanged.
+        """
+
+        # validate before assigning anything, so that a failed call leaves the connection as it was
+        if enable:
+            _check_proxy_settings(host, port, protocol)
+
+        self._proxy_host = host
+        self._proxy_port = port
+        self._proxy_protocol = protocol
+        self._proxy_user_name = username
+        self._proxy_password = password
+        self._use_proxy = enable
+        self._invalidate()
+
         self._generate_session()
-            
+
         return
-    
+
    
+    def _invalidate(self) -> None:
+        """Internal class method to mark the session and string representation as out of date after a setting has changed
+        
+        """
+        self._session_dirty = True
+        self._repr_cache = None
+        
+        return
+    
     def _generate_session(self) -> requests.Session:
         """Internal class method to generate a requests session object
+        
+        Raises:
+            ValueError: if the proxy is used, but the proxy host, port, or protocol is not set
 
         """
         
-        # create a requests session
+        # without a proxy, the connection gets a plain session that uses the shared FFIEC connection pool
+        if not self._use_proxy:
+            session = requests.Session()
+            _mount_ffiec_adapter(session)
+            self.session = session
+            
+            return
+        
+        # check that we have a hostname, port, and protocol. If not, raise an error
+        _check_proxy_settings(self._proxy_host, self._proxy_port, self._proxy_protocol)
+        
+        # we are using a proxy, so create a requests session for this connection
         session = requests.Session()
         
-        # are we using a proxy?
-        if self.use_proxy:
-            
-            # check that we have a hostname, port, and protocol. If not, raise an error
-            if self.proxy_host is None or self.proxy_port is None or self.proxy_protocol is None:
-                raise()
-            
-            
-            # if we are using a proxy, set the proxy host and port
-            session.proxies = {self.proxy_protocol.name: 'http://' + self.proxy_host + ':' + str(self.proxy_port)}
-            # if we have a username and password, set the proxy username and password
-            if self.proxy_user_name is not None and self.proxy_password is not None:
-                session.proxies['http']['proxy_auth'] = (self._proxy_user_name, self.proxy_password)
+        # if we have a username and password, include them in the proxy url
+        if self._proxy_user_name is not None and self._proxy_password is not None:
+            proxy_url = f"http://{quote(self._proxy_user_name, safe='')}:{quote(self._proxy_password, safe='')}@{self._proxy_host}:{self._proxy_port}"
+        else:
+            proxy_url = f"http://{self._proxy_host}:{self._proxy_port}"
+        
+        # set the proxy host and port
+        session.proxies = {_PROXY_SCHEMES[self._proxy_protocol]: proxy_url}
         
          # set the session to self.connection
         self.session = session
@@ -259,19 +389,36 @@ class FFIECConnection(object):
         An alternative web site may be selected in lieu of google.com,
         using the url parameter.
         
+        Only the response headers are requested, and the request times out
+        if the site (or proxy server) does not respond within a few seconds.
+        If the site does not allow HEAD requests, a GET request is made instead,
+        and closed without reading the page.
+        
         """
         
-        # can we return a HTTP 200 from google.com, or the url specified??
+        # can we return a successful response from google.com, or the url specified??
         
         if url is None:
             url = "https://google.com"
         
-        response = self.session.get(url)
+        # a HEAD request is enough to check the status, without downloading the page;
+        # redirects are not followed, since a redirect already shows that the site is reachable
+        response = self.session.head(url, timeout=(3.05, 5), allow_redirects=False)
+        
+        # some sites do not allow HEAD, so fall back to a streamed GET, closed before the body is read
+        if response.status_code == 405:
+            response = self.session.get(url, stream=True, timeout=(3.05, 5), allow_redirects=False)
+            try:
+                status_code = response.status_code
+            finally:
+                response.close()
+        else:
+            status_code = response.status_code
         
-        if response.status_code == 200:
+        if status_code < 400:
             return True
         else:
-            print("Unable to access test site via proxy. Error: " + str(response.status_code))
+            print("Unable to access test site via proxy. Error: " + str(status_code))
             return False
 
 
@@ -283,21 +430,25 @@ class FFIECConnection(object):
             str: the string representation of the HttpsConnection object
         
         """
-        return f"""
+        # the representation only changes when a setting changes, so it is built once and cached until then
+        if self._repr_cache is None:
+            self._repr_cache = f"""
         HttpsConnection object properties:
         
-        Https connection session is {'active' if self.session is not None else 'inactive'}
+        Https connection session is {'active' if self._session is not None else 'inactive'}
         
         
-        proxy hostname = {self.proxy_host}
-        proxy port = {self.proxy_port}
-        proxy protocol = {self.proxy_protocol}
-        is the proxy active? = {self.use_proxy}
-        proxy username = {self.proxy_user_name}
-        is proxy password set? = {self.proxy_password is not None}
+        proxy hostname = {self._proxy_host}
+        proxy port = {self._proxy_port}
+        proxy protocol = {self._proxy_protocol}
+        is the proxy active? = {self._use_proxy}
+        proxy username = {self._proxy_user_name}
+        is proxy password set? = {self._proxy_password is not None}
         
         """
         
+        return self._repr_cache
+        
     
 
     def __repr__(self) -> str:
@@ -5,23 +5,30 @@ The methods contained in this module are utilized to call and collect data from
 """
 
 import re
+import functools
 import requests
-import pandas as pd
-from typing import Union
+from typing import Union, TYPE_CHECKING
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from zeep import Client, Settings
-from zeep.wsse.username import UsernameToken
-from zeep.transports import Transport
-from ffiec_data_connect import datahelpers, credentials, constants, xbrl_processor, ffiec_connection
+from ffiec_data_connect import datahelpers, credentials, xbrl_processor, ffiec_connection
 
-# global date regex
-quarterStringRegex = r"^[1-4](q|Q)([0-9]{4})$"
-yyyymmddRegex = r"^[0-9]{4}[0-9]{2}[0-9]{2}$"
-yyyymmddDashRegex = r"^[0-9]{4}-[0-9]{2}-[0-9]{2}$"
-mmddyyyyRegex = r"^[0-9]{1,2}/[0-9]{1,2}/[0-9]{4}$"
+# pandas and zeep are imported where they are used, so that importing this module does not pay for importing them
+if TYPE_CHECKING:
+    import pandas as pd
+    from zeep import Client
 
-validRegexList = [quarterStringRegex, yyyymmddRegex, yyyymmddDashRegex, mmddyyyyRegex]
+# global date regex, compiled once at import
+_QUARTER_RE = re.compile(r"^[1-4][qQ]([0-9]{4})$")
+_YYYYMMDD_DASH_RE = re.compile(r"^[0-9]{4}-[0-9]{2}-[0-9]{2}$")
+_MMDDYYYY_RE = re.compile(r"^[0-9]{1,2}/[0-9]{1,2}/[0-9]{4}$")
+
+# the (month, day) that each quarter ends on, indexed by quarter number
+_QUARTER_ENDS = (None, (3, 31), (6, 30), (9, 30), (12, 31))
+_QUARTER_END_DATES = frozenset(_QUARTER_ENDS[1:])
+
+# the accepted values of the output_type and date_output_format arguments
+_VALID_OUTPUT_TYPES = frozenset({"list", "pandas"})
+_VALID_DATE_FORMATS = frozenset({"string_original", "string_yyyymmdd", "python_format"})
 
 
 def _create_ffiec_date_from_datetime(indate: datetime) -> str:
@@ -33,13 +40,78 @@ def _create_ffiec_date_from_datetime(indate: datetime) -> str:
     Returns:
         str: the date in FFIEC format
     """
-    month_str = str(indate.month)
-    day_str = str(indate.day)
-    year_str = str(indate.year)
+    return f"{indate.month}/{indate.day}/{indate.year}"
+
+def _parse_ffiec_datetime(indate: str) -> datetime:
+    """Converts a FFIEC-formatted date and time (e.g. "3/31/2020 4:05:12 PM") to a datetime object
+
+    The fixed format is parsed directly rather than through `datetime.strptime`,
+    which avoids interpreting a format string on every call.
+
+    Args:
+        indate (str): the date and time to convert, in the format "m/d/yyyy h:mm:ss AM"
+
+    Returns:
+        datetime: the date and time, as a naive datetime object
+    """
+    date_part, time_part, meridiem = indate.split(" ")
+    month, day, year = date_part.split("/")
+    hour, minute, second = time_part.split(":")
     
-    mmddyyyy = month_str + "/" + day_str + "/" + year_str
+    # convert the 12-hour clock to a 24-hour clock
+    hour = int(hour)
+    if meridiem == "PM" and hour < 12:
+        hour += 12
+    elif meridiem == "AM" and hour == 12:
+        hour = 0
     
-    return mmddyyyy
+    return datetime(int(year), int(month), int(day), hour, int(minute), int(second))
+
+def _parse_dash_date(indate: str) -> datetime:
+    """Converts a date in the format "YYYY-MM-DD" to a datetime object"""
+    year, month, day = indate.split("-")
+    return datetime(int(year), int(month), int(day))
+
+def _parse_slash_date(indate: str) -> datetime:
+    """Converts a date in the format "MM/DD/YYYY" to a datetime object"""
+    month, day, year = indate.split("/")
+    return datetime(int(year), int(month), int(day))
+
+def _parse_yyyymmdd_date(indate: str) -> datetime:
+    """Converts a date in the format "YYYYMMDD" to a datetime object, or None if the date is not 8 digits long"""
+    if len(indate) != 8:
+        return None
+    return datetime(int(indate[:4]), int(indate[4:6]), int(indate[6:]))
+
+
+# the date parser for each separator character; a date of only digits has no separator
+_DATE_PARSERS = {
+    "-": _parse_dash_date,
+    "/": _parse_slash_date,
+    "": _parse_yyyymmdd_date,
+}
+
+
+def _parse_date_fast(indate: str) -> datetime:
+    """Converts a string-based date to a datetime object, without regex or `datetime.strptime`
+
+    The format is selected by the first character of the date that is not a digit.
+
+    Args:
+        indate (str): the date to convert, in the format of "YYYY-MM-DD", "YYYYMMDD", or "MM/DD/YYYY"
+
+    Returns:
+        datetime: the date, or None if the date is not in a supported format
+        
+    Raises:
+        ValueError: if the date has a supported separator, but is not a valid date
+    """
+    parser = _DATE_PARSERS.get(indate.strip("0123456789")[:1])
+    
+    if parser is None:
+        return None
+    
+    return parser(indate)
 
 def _convert_any_date_to_ffiec_format(indate: str or datetime) -> str:
     """Converts a string-based date or python datetime object to a FFIEC-formatted date
@@ -49,50 +121,58 @@ def _convert_any_date_to_ffiec_format(indate: str or datetime) -> str:
 
     Returns:
         str: the date in FFIEC format
+        
+    Raises:
+        ValueError: if the date is not in one of the supported formats
     """
     
     if isinstance(indate, datetime):
         return _create_ffiec_date_from_datetime(indate)
     elif isinstance(indate, str):
-        # does the date have two slashes?
-        if indate.count("-") == 2:
-            return _create_ffiec_date_from_datetime(datetime.strptime(indate, "%Y-%m-%d"))
-        elif indate.count("/") == 2:
-            return _create_ffiec_date_from_datetime(datetime.strptime(indate, "%m/%d/%Y"))
-        elif len(indate) == 8:
-            return _create_ffiec_date_from_datetime(datetime.strptime(indate, "%Y%m%d"))  
-    else:
-        # raise an error if we don't have a valid date
-        raise(ValueError("Invalid date format. Must be a string in the format of 'YYYY-MM-DD', 'YYYYMMDD', 'MM/DD/YYYY', or a python datetime object"))
+        ffiec_date = _convert_str_date_to_ffiec(indate)
+        if ffiec_date is not None:
+            return ffiec_date
+    
+    # raise an error if we don't have a valid date
+    raise(ValueError("Invalid date format. Must be a string in the format of 'YYYY-MM-DD', 'YYYYMMDD', 'MM/DD/YYYY', or a python datetime object"))
+
+@functools.lru_cache(maxsize=256)
+def _convert_str_date_to_ffiec(indate: str) -> str:
+    """Converts a string-based date to a FFIEC-formatted date
+    
+    Results are cached, since the same few reporting periods are typically converted
+    once for each institution that is queried.
+
+    Args:
+        indate (str): the date to convert, in the format of "YYYY-MM-DD", "YYYYMMDD", or "MM/DD/YYYY"
+
+    Returns:
+        str: the date in FFIEC format, or None if the date is not in a supported format
+    """
+    parsed_date = _parse_date_fast(indate)
+    
+    if parsed_date is None:
+        return None
+    
+    return _create_ffiec_date_from_datetime(parsed_date)
     
 def _convert_quarter_to_date(reporting_period: str) -> datetime:
     
     """Converts date in the format of #QYYYY to a datetime object
 
     Returns:
-        _type_: _description_
+        datetime: the last day of the quarter, or None if the reporting period is not a quarter string
     """
     
     # convert the reporting period to a datetime object
-    if re.search(quarterStringRegex, reporting_period):
-        # the reporting period is a quarter string
-        # get the quarter number
-        quarter_number = int(reporting_period[0])
-        # get the year
-        year = int(reporting_period[-4:])
-
-        if quarter_number == 1:
-            # first quarter
-            return datetime(year, 3, 31)
-        elif quarter_number == 2:
-            return datetime(year, 6, 30)
-        elif quarter_number == 3:
-            return datetime(year, 9, 30)
-        elif quarter_number == 4:
-            return datetime(year, 12, 31)
-        else:
-            raise(ValueError("Invalid quarter number")) # raise an error if we don't have a valid quarter number
-    pass
+    quarter_match = _QUARTER_RE.match(reporting_period)
+    if quarter_match:
+        # the reporting period is a quarter string; the pattern only allows quarters 1 through 4
+        month, day = _QUARTER_ENDS[int(reporting_period[0])]
+        
+        return datetime(int(quarter_match.group(1)), month, day)
+    
+    return None
     
 
 def _is_valid_date_or_quarter(reporting_period: str or datetime) -> bool:
@@ -127,119 +207,96 @@ def _is_valid_date_or_quarter(reporting_period: str or datetime) -> bool:
             else:
                 return False
     elif isinstance(reporting_period, str):
-        # does our date match any of the valid regexes?
-        return any(re.search(regex, reporting_period) for regex in validRegexList)
+        # the second character and the separator identify the only format the string could be in,
+        # so at most one pattern needs to be tried
+        if reporting_period[1:2] in ("q", "Q"):
+            return bool(_QUARTER_RE.match(reporting_period))
+        elif "-" in reporting_period:
+            return bool(_YYYYMMDD_DASH_RE.match(reporting_period))
+        elif "/" in reporting_period:
+            return bool(_MMDDYYYY_RE.match(reporting_period))
+        else:
+            return len(reporting_period) == 8 and reporting_period.isascii() and reporting_period.isdigit()
     else:
         return False # we don't know what to do with this type of input, so return false
     
     
 def _return_ffiec_reporting_date(indate: datetime or str) -> str:
-    if isinstance(indate, datetime):
-        return _create_ffiec_date_from_datetime(indate)
-    elif isinstance(indate, str):
-        if indate[1] == "Q":
-            return _create_ffiec_date_from_datetime(_convert_quarter_to_date(indate))
-        else:
-            ffiec_date =  _convert_any_date_to_ffiec_format(indate)
-            ffiec_date_month = ffiec_date.split("/")[0]
-            ffiec_date_date = ffiec_date.split("/")[1]
-            
-            if (ffiec_date_month == "3" or ffiec_date_month == "03") and ffiec_date_date == "31":
-                return ffiec_date
-            elif (ffiec_date_month == "6" or ffiec_date_month == "06") and ffiec_date_date == "30":
-                return ffiec_date
-            elif (ffiec_date_month == "9" or ffiec_date_month == "09") and ffiec_date_date == "30":
-                return ffiec_date
-            elif ffiec_date_month == "12" and ffiec_date_date == "31":
-                return ffiec_date
-            else:
-                raise(ValueError("Invalid date format. Must be a string in the format of 'YYYY-MM-DD', 'YYYYMMDD', 'MM/DD/YYYY', or a python datetime object"))
-    
-def _output_type_validator(output_type: str) -> bool:
-    """Internal function to validate the output_type
+    """Converts a reporting period to a FFIEC-formatted date
     
     Args:
-        output_type (str): the output_type to validate
-    
+        indate (datetime or str): the reporting period, as a python datetime object, a #QYYYY quarter string,
+            or a string in the format of "YYYY-MM-DD", "YYYYMMDD", or "MM/DD/YYYY" that falls on the last day of a quarter
+
     Returns:
-        bool: True if valid, False if not
+        str: the reporting period in FFIEC format
     """
-    if output_type not in ['list', 'pandas']:
-        raise(ValueError("Invalid output_type. Must be 'list' or 'pandas'"))
-    else:
-        return True
-    
-def _date_format_validator(date_format: str) -> bool:
-    """Internal function to validate the date_format
+    if isinstance(indate, datetime):
+        return _create_ffiec_date_from_datetime(indate)
+    elif isinstance(indate, str):
+        return _return_ffiec_reporting_date_from_str(indate)
+
+@functools.lru_cache(maxsize=256)
+def _return_ffiec_reporting_date_from_str(indate: str) -> str:
+    """Converts a string-based reporting period to a FFIEC-formatted date
     
+    This is kept separate from `_return_ffiec_reporting_date` so that only strings are cached:
+    aware datetimes in different timezones may compare equal while falling on different dates.
+
     Args:
-        date_format (str): the date_format to validate
-    
+        indate (str): the reporting period, as a #QYYYY quarter string, or a quarter-end date in a format accepted by `_parse_date_fast`
+
     Returns:
-        bool: True if valid, False if not
-    """
-    if date_format not in ['string_original', 'string_yyyymmdd', 'python_format']:
-        raise(ValueError("Invalid date_format. Must be 'string_original', 'string_yyyymmdd', or 'python_format'"))
-    else:
-        return True
+        str: the reporting period in FFIEC format
     
-
-def _credentials_validator(creds: credentials.WebserviceCredentials) -> bool:
-    """Internal function to validate the credentials
+    Raises:
+        ValueError: if the date is not in a supported format, or is not the last day of a quarter
+    """
+    # quarter strings (with an upper or lower case q) are tried first, since any other string is parsed as a date
+    quarter_date = _convert_quarter_to_date(indate)
+    if quarter_date is not None:
+        return _create_ffiec_date_from_datetime(quarter_date)
     
-    Args:
-        credentials (credentials.WebserviceCredentials): the credentials to validate
+    parsed_date = _parse_date_fast(indate)
     
-    Returns:
-        bool: True if valid, False if not
-    """
-    if not isinstance(creds, credentials.WebserviceCredentials):
-        raise(ValueError("Invalid credentials. Must be a WebserviceCredentials instance"))
+    # only format the date once it is known to be the last day of a quarter
+    if parsed_date is not None and (parsed_date.month, parsed_date.day) in _QUARTER_END_DATES:
+        return _create_ffiec_date_from_datetime(parsed_date)
     else:
-        return True
+        raise(ValueError("Invalid date format. Must be a string in the format of 'YYYY-MM-DD', 'YYYYMMDD', 'MM/DD/YYYY', or a python datetime object"))
+    
+def _validate_call_args(output_type: str, creds: credentials.WebserviceCredentials, session: requests.Session, date_format: str = None) -> bool:
+    """Internal function to validate the arguments common to the `collect_*` methods
     
-def _session_validator(session: requests.Session) -> bool:
-    """Internal function to validate the session
+    Validates the output_type, the date_format (if the method accepts one), the credentials, and the session, in that order.
     
     Args:
+        output_type (str): the output_type to validate
+        creds (credentials.WebserviceCredentials): the credentials to validate
         session (requests.Session): the session to validate
+        date_format (str, optional): the date_format to validate. Defaults to None, which skips the check.
     
     Returns:
-        bool: True if valid, False if not
-    """
-    if isinstance(session, ffiec_connection.FFIECConnection):
-        return True
-    elif isinstance(session, requests.Session):
-        return True
-    else:
-        raise(ValueError("Invalid session/connection. Must be a requests.Session instance or FFIECConnection instance"))
+        bool: True if valid
     
-def _return_client_session(session: requests.Session, creds: credentials.WebserviceCredentials) -> Client:
+    Raises:
+        ValueError: if any of the arguments is not valid
+    """
+    if output_type not in _VALID_OUTPUT_TYPES:
+        raise(ValueError("Invalid output_type. Must be 'list' or 'pandas'"))
     
-    """Internal function to return a zeep client session
+    if date_format is not None and date_format not in _VALID_DATE_FORMATS:
+        raise(ValueError("Invalid date_format. Must be 'string_original', 'string_yyyymmdd', or 'python_format'"))
     
-    Args:
-        session (requests.Session): the requests.Session object to use
-        creds (credentials.WebserviceCredentials): the credentials to use
-
-    Returns:
-        _type_: _description_
-    """
+    if not isinstance(creds, credentials.WebserviceCredentials):
+        raise(ValueError("Invalid credentials. Must be a WebserviceCredentials instance"))
     
-    # create a transport
-    transport = Transport(session=session)
+    if not isinstance(session, (ffiec_connection.FFIECConnection, requests.Session)):
+        raise(ValueError("Invalid session/connection. Must be a requests.Session instance or FFIECConnection instance"))
     
-    wsse = UsernameToken(creds.username, creds.password)
-                         
-    # create the client
-    soap_client = Client(constants.WebserviceConstants.base_url, wsse=wsse, transport=transport)
+    return True
     
-    return soap_client
-
-
-
-
-def collect_reporting_periods(session: requests.Session, creds: credentials.WebserviceCredentials, series= "call", output_type = "list", date_output_format="string_original") -> Union[list, pd.Series]:
+def collect_reporting_periods(session: requests.Session, creds: credentials.WebserviceCredentials, series= "call", output_type = "list", date_output_format="string_original") -> Union[list, "pd.Series"]:
     """Returns list of reporting periods available for access via the FFIEC webservice
 
     | Note on `date_output_format`:
@@ -261,10 +318,7 @@ def collect_reporting_periods(session: requests.Session, creds: credentials.Webs
         
     """
     
-    _ = _output_type_validator(output_type)
-    _ = _date_format_validator(date_output_format)
-    _ = _credentials_validator(creds)
-    _ = _session_validator(session)
+    _ = _validate_call_args(output_type, creds, session, date_output_format)
 
     
     ## we have a session and valid credentials, so try to log in
@@ -284,28 +338,67 @@ def collect_reporting_periods(session: requests.Session, creds: credentials.Webs
         raise ValueError("No reporting periods returned.")
     
     ret_date_formatted = ret
+    
+    # the webservice returns dates as YYYY-MM-DD, so check the shape once and then convert by slicing
+    if date_output_format != "string_original" and not all(_YYYYMMDD_DASH_RE.match(x) for x in ret):
+        raise ValueError("Unexpected reporting period format returned. Expected 'YYYY-MM-DD'.")
         
     if date_output_format == "string_yyyymmdd":
-        ret_date_formatted = [datetime.strftime(datetime.strptime(x, "%Y-%m-%d"), "%Y%m%d") for x in ret]
+        ret_date_formatted = [x[:4] + x[5:7] + x[8:] for x in ret]
     elif date_output_format == "python_format":
-        ret_date_formatted =  [datetime.strptime(x, "%Y-%m-%d") for x in ret]
+        ret_date_formatted =  [datetime(int(x[:4]), int(x[5:7]), int(x[8:])) for x in ret]
     # the default is to return the original string
         
-    if output_type == "list":
-        return ret_date_formatted
-    elif output_type == "pandas":
+    if output_type == "pandas":
+        import pandas as pd
+        
         return pd.DataFrame(ret_date_formatted, columns=['reporting_period'])
-    else:
-        # for now, default is to return a list
-        return ret_date_formatted
     
-    pass
+    return ret_date_formatted
     
 
-def _client_factory(session, creds)-> Client:
-    """Creates a zeep client session
+def _rows_to_columns(rows: list, keys: tuple) -> dict:
+    """Internal function to convert a list of dicts to a dict of lists, one list for each key
+    
+    pandas builds a DataFrame from a dict of lists column by column,
+    rather than inferring the columns from each row.
+    
+    Args:
+        rows (list): the rows to convert
+        keys (tuple): the keys of each row, in column order
+    
+    Returns:
+        dict: a list of values for each key
+    """
+    return {key: [row[key] for row in rows] for key in keys}
     
-    Determines whether the session argument is an FFIECConnection instance or a requests.Session instance.
+
+def _build_xbrl_dataframe(rows: list) -> "pd.DataFrame":
+    """Internal function to build a pandas DataFrame from the rows returned by `xbrl_processor._process_xml`
+    
+    Args:
+        rows (list): the processed XBRL rows
+    
+    Returns:
+        pd.DataFrame: a DataFrame with one column for each field in `xbrl_processor._XBRL_COLUMNS`
+    """
+    import pandas as pd
+    
+    return pd.DataFrame(_rows_to_columns(rows, xbrl_processor._XBRL_COLUMNS))
+
+
+# the function that builds the output of collect_data for each output_type
+_XBRL_OUTPUT_BUILDERS = {
+    "list": lambda rows: rows,
+    "pandas": _build_xbrl_dataframe,
+}
+    
+
+def _client_factory(session, creds)-> "Client":
+    """Returns the zeep client session for the session and credentials
+    
+    Validates that the session argument is an FFIECConnection instance or a requests.Session instance.
+    The client is cached by the credentials (see `WebserviceCredentials.get_client`), so repeated calls reuse the parsed WSDL.
 
     Args:
         session (_type_): _description_
@@ -315,15 +408,13 @@ def _client_factory(session, creds)-> Client:
         Client: _description_
     """
         ## we have a session and valid credentials, so try to log in
-    if isinstance(session, ffiec_connection.FFIECConnection):
-        return  _return_client_session(session.session, creds)
-    elif isinstance(session, requests.Session):
-        return _return_client_session(session, creds)
+    if isinstance(session, (ffiec_connection.FFIECConnection, requests.Session)):
+        return creds.get_client(session)
     else:
         raise Exception("Invalid session. Must be a FFIECConnection or requests.Session instance")
     
 
-def collect_data(session: Union[ffiec_connection.FFIECConnection, requests.Session], creds: credentials.WebserviceCredentials, reporting_period: Union[str, datetime], rssd_id:str, series: str, output_type = "list", date_output_format ="string_original") -> Union[list, pd.DataFrame]:
+def collect_data(session: Union[ffiec_connection.FFIECConnection, requests.Session], creds: credentials.WebserviceCredentials, reporting_period: Union[str, datetime], rssd_id:str, series: str, output_type = "list", date_output_format ="string_original") -> Union[list, "pd.DataFrame"]:
     """Return time series data from the FFIEC webservice for a given reporting period and RSSD ID
 
     Translates the input reporting period to a FFIEC-formatted date
@@ -351,10 +442,7 @@ def collect_data(session: Union[ffiec_connection.FFIECConnection, requests.Sessi
         list or pandas: Returns either a list of dicts or a pandas DataFrame
         
     """
-    _ = _output_type_validator(output_type)
-    _ = _date_format_validator(date_output_format)
-    _ = _credentials_validator(creds)
-    _ = _session_validator(session)
+    _ = _validate_call_args(output_type, creds, session, date_output_format)
     
 
     client = _client_factory(session, creds)
@@ -377,15 +465,10 @@ def collect_data(session: Union[ffiec_connection.FFIECConnection, requests.Sessi
     
     processed_ret = xbrl_processor._process_xml(ret, date_output_format)
     
-    if output_type == "list":
-        return processed_ret
-    elif output_type == "pandas":
-        return pd.DataFrame(processed_ret)
+    return _XBRL_OUTPUT_BUILDERS[output_type](processed_ret)
     
-    return processed_ret
     
-    
-def collect_filers_since_date(session: Union[ffiec_connection.FFIECConnection , requests.Session], creds: credentials.WebserviceCredentials, reporting_period: Union[str, datetime], since_date: Union[str, datetime], output_type = "list") -> Union[list, pd.Series]:
+def collect_filers_since_date(session: Union[ffiec_connection.FFIECConnection , requests.Session], creds: credentials.WebserviceCredentials, reporting_period: Union[str, datetime], since_date: Union[str, datetime], output_type = "list") -> Union[list, "pd.Series"]:
     """Retrieves the ID RSSDs of the reporters who have filed after a given date for a given reporting period. Note that this function only reports on Call Report filings, not UBPR filings.
     
     | `Valid arguments for the ``since_date`` argument:
@@ -412,9 +495,7 @@ def collect_filers_since_date(session: Union[ffiec_connection.FFIECConnection ,
     """
     
     # conduct standard validation on function input arguments
-    _ = _output_type_validator(output_type)
-    _ = _credentials_validator(creds)
-    _ = _session_validator(session)
+    _ = _validate_call_args(output_type, creds, session)
     
     is_valid_reporting_period = _is_valid_date_or_quarter(reporting_period)
     if not is_valid_reporting_period:
@@ -427,22 +508,18 @@ def collect_filers_since_date(session: Union[ffiec_connection.FFIECConnection ,
     since_date_ffiec = _convert_any_date_to_ffiec_format(since_date)
     reporting_period_datetime_ffiec = _return_ffiec_reporting_date(reporting_period)
     
-
-    
     ret = client.service.RetrieveFilersSinceDate(dataSeries="Call",  lastUpdateDateTime=since_date_ffiec, reportingPeriodEndDate=reporting_period_datetime_ffiec)
     
-    
+    # the webservice already returns a list of rssd ids, so the list output needs no conversion and does not touch pandas
     if output_type == "list":
         return ret
-    elif output_type == "pandas":
-        return pd.DataFrame(ret, columns=['rssd_id'])
-    else:
-        # for now, default is to return a list
-        return ret
     
+    import pandas as pd
+    
+    return pd.DataFrame(ret, columns=['rssd_id'])
     
 
-def collect_filers_submission_date_time(session: Union[ffiec_connection.FFIECConnection, requests.Session], creds: credentials.WebserviceCredentials, since_date: str or datetime, reporting_period: str or datetime, output_type = "list", date_output_format ="string_original") -> Union[list, pd.DataFrame]:
+def collect_filers_submission_date_time(session: Union[ffiec_connection.FFIECConnection, requests.Session], creds: credentials.WebserviceCredentials, since_date: str or datetime, reporting_period: str or datetime, output_type = "list", date_output_format ="string_original") -> Union[list, "pd.DataFrame"]:
     """Retrieves the ID RSSDs and DateTime of the reporters who have filed after a given date for a given reporting period. Note that this function only reports on Call Report filings, not UBPR filings.
 
     | Note on `date_output_format`:
@@ -465,10 +542,7 @@ def collect_filers_submission_date_time(session: Union[ffiec_connection.FFIECCon
     
         
     # conduct standard validation on function input arguments
-    _ = _output_type_validator(output_type)
-    _ = _date_format_validator(date_output_format)
-    _ = _credentials_validator(creds)
-    _ = _session_validator(session)
+    _ = _validate_call_args(output_type, creds, session, date_output_format)
     
     is_valid_reporting_period = _is_valid_date_or_quarter(reporting_period)
     if not is_valid_reporting_period:
@@ -483,38 +557,33 @@ def collect_filers_submission_date_time(session: Union[ffiec_connection.FFIECCon
     reporting_period_datetime_ffiec = _return_ffiec_reporting_date(reporting_period)
     
     # send the request
-    
-    # first, create the client
-    client = _client_factory(session, creds)
-    
     ret = client.service.RetrieveFilersSubmissionDateTime(dataSeries="Call", lastUpdateDateTime=since_date_ffiec, reportingPeriodEndDate=reporting_period_datetime_ffiec)
     
-    # normalize the output
-    normalized_ret = [{"rssd":x["ID_RSSD"], "datetime":x["DateTime"]} for x in ret]
+    # normalize the output into one column of rssd ids and one column of submission times
+    rssd_ids = [x["ID_RSSD"] for x in ret]
+    submission_datetimes = [x["DateTime"] for x in ret]
 
     # all submission times are in eastern time, so if we are converting to a python datetime,
     # the datetime object needs to be timezone aware, so that the user may convert the time to their local timezone    
     origin_tz = ZoneInfo("US/Eastern")
-
-    
-    if date_output_format == "python_format":
-        normalized_ret = [{"rssd":x["rssd"], "datetime":datetime.strptime(x["datetime"], "%m/%d/%Y %H:%M:%S %p").replace(tzinfo=origin_tz)} for x in normalized_ret]
     
-
-    # convert the datetime to a string, if user requests
-    
-    if output_type == "list":
-        return normalized_ret
-    elif output_type == "pandas":
-        return pd.DataFrame(normalized_ret)
-    else:
-        # for now, default is to return a list
-        return ret
+    if output_type == "pandas":
+        import pandas as pd
+        import numpy as np
+        
+        if date_output_format == "python_format":
+            # parse the whole column at once; times in the repeated hour at the end of daylight saving time are taken
+            # as daylight time, and times in the skipped hour are moved forward an hour, as ZoneInfo does for single datetimes
+            submission_datetimes = pd.to_datetime(submission_datetimes, format="%m/%d/%Y %I:%M:%S %p").tz_localize(origin_tz, ambiguous=np.ones(len(submission_datetimes), dtype=bool), nonexistent=pd.Timedelta(hours=1))
+        
+        return pd.DataFrame({"rssd": rssd_ids, "datetime": submission_datetimes})
     
+    if date_output_format == "python_format":
+        submission_datetimes = [_parse_ffiec_datetime(x).replace(tzinfo=origin_tz) for x in submission_datetimes]
     
-    pass
+    return [{"rssd": rssd, "datetime": submission_datetime} for rssd, submission_datetime in zip(rssd_ids, submission_datetimes)]
 
-def collect_filers_on_reporting_period(session: Union[ffiec_connection.FFIECConnection, requests.Session], creds: credentials.WebserviceCredentials, reporting_period: Union[str, datetime], output_type = "list") -> Union[list, pd.DataFrame]:
+def collect_filers_on_reporting_period(session: Union[ffiec_connection.FFIECConnection, requests.Session], creds: credentials.WebserviceCredentials, reporting_period: Union[str, datetime], output_type = "list") -> Union[list, "pd.DataFrame"]:
     """Retrieves the Financial Institutions in a Panel of Reporters for a given reporting period. Note that this function only reports on Call Report filings, not UBPR filings.
 
     | `Valid arguments for the ``reporting_period`` argument:
@@ -536,9 +605,7 @@ def collect_filers_on_reporting_period(session: Union[ffiec_connection.FFIECConn
     """
     
         # conduct standard validation on function input arguments
-    _ = _output_type_validator(output_type)
-    _ = _credentials_validator(creds)
-    _ = _session_validator(session)
+    _ = _validate_call_args(output_type, creds, session)
     
     is_valid_reporting_period = _is_valid_date_or_quarter(reporting_period)
     if not is_valid_reporting_period:
@@ -550,13 +617,11 @@ def collect_filers_on_reporting_period(session: Union[ffiec_connection.FFIECConn
     
     ret = client.service.RetrievePanelOfReporters(dataSeries="Call", reportingPeriodEndDate=reporting_period_datetime_ffiec)
     
-    normalized_ret = [datahelpers._normalize_output_from_reporter_panel(x) for x in ret]
+    if output_type == "pandas":
+        import pandas as pd
+        
+        # normalize each row to a tuple, so that no intermediate dict is built for each row
+        return pd.DataFrame.from_records([datahelpers._normalize_output_from_reporter_panel_tuple(x) for x in ret], columns=datahelpers._REPORTER_PANEL_COLUMNS)
     
-    if output_type == "list":
-        return normalized_ret
-    elif output_type == "pandas":
-        return pd.DataFrame(normalized_ret)
-    else:
-        # for now, default is to return a list
-        return ret
+    return [datahelpers._normalize_output_from_reporter_panel(x) for x in ret]
     
@@ -5,7 +5,10 @@ import xmltodict
 from datetime import datetime
 import re
 
-re_date = re.compile('[0-9]{4}\-[0-9]{2}\-[0-9]{2}')
+re_date = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+
+# the fields of each row returned by _process_xml, in column order
+_XBRL_COLUMNS = ('mdrm', 'rssd', 'quarter', 'int_data', 'float_data', 'bool_data', 'str_data', 'data_type')
 
 def _process_xml(data: bytes, output_date_format: str):
     #data = zipfile_stream.open(first_file).read()
@@ -15,46 +18,19 @@ def _process_xml(data: bytes, output_date_format: str):
     parsed_data = list(chain.from_iterable(filter(None,list(map(lambda x: _process_xbrl_item(x, dict_data[x], output_date_format),keys_to_parse,)))))
     ret_data = []
     for row in parsed_data:
-        new_dict = {}
-        new_dict.update({'mdrm':row['mdrm']})
-        new_dict.update({'rssd':row['rssd']})
-        new_dict.update({'quarter':row['quarter']})
-        if row['data_type'] == 'int':
-            new_dict.update({'int_data':int(row['value'])})
-            new_dict.update({'float_data':None})
-            new_dict.update({'bool_data':None})
-            new_dict.update({'str_data':None})
-            new_dict.update({'data_type':row['data_type']})
-
-        elif row['data_type'] == 'float':
-            new_dict.update({'int_data':None})
-            new_dict.update({'float_data':row['value']})
-            new_dict.update({'bool_data':None})
-            new_dict.update({'str_data':None})
-            new_dict.update({'data_type':row['data_type']})
-
-        elif row['data_type'] == 'str':
-            new_dict.update({'int_data':None})
-            new_dict.update({'float_data':None})
-            new_dict.update({'bool_data':None})
-            new_dict.update({'str_data':row['value']})
-            new_dict.update({'data_type':row['data_type']})
-
-        elif row['data_type'] == 'float':
-            new_dict.update({'int_data':None})
-            new_dict.update({'float_data':row['value']})
-            new_dict.update({'bool_data':None})
-            new_dict.update({'data_type':row['data_type']})
-            new_dict.update({'str_data':None})
-
-        elif row['data_type'] == 'bool':
-            new_dict.update({'int_data':None})
-            new_dict.update({'float_data':None})
-            new_dict.update({'bool_data':row['value']})
-            new_dict.update({'data_type':row['data_type']})
-            new_dict.update({'str_data':None})
-
-        ret_data.append(new_dict)
+        # build each output row in one pass, with the value in the column matching its data type
+        data_type = row['data_type']
+        value = row['value']
+        ret_data.append({
+            'mdrm': row['mdrm'],
+            'rssd': row['rssd'],
+            'quarter': row['quarter'],
+            'int_data': int(value) if data_type == 'int' else None,
+            'float_data': value if data_type == 'float' else None,
+            'bool_data': value if data_type == 'bool' else None,
+            'str_data': value if data_type == 'str' else None,
+            'data_type': data_type,
+        })
     
     return ret_data
 
@@ -68,13 +44,7 @@ def _create_ffiec_date_from_datetime(indate: datetime) -> str:
     Returns:
         str: the date in FFIEC format
     """
-    month_str = str(indate.month)
-    day_str = str(indate.day)
-    year_str = str(indate.year)
-    
-    mmddyyyy = month_str + "/" + day_str + "/" + year_str
-    
-    return mmddyyyy
+    return f"{indate.month}/{indate.day}/{indate.year}"
 
 def _process_xbrl_item(name, items, date_format):
     # incoming is a data dictionary
@@ -89,7 +59,7 @@ def _process_xbrl_item(name, items, date_format):
         rssd = context.split('_')[1]
         #date = int(context.split('_')[2].replace("-",''))
 
-        quarter = re_date.findall(context)[0]
+        quarter = re_date.search(context).group()
 
         # transform the date to the requested date format
         if date_format == 'string_original':
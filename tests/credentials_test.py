@@ -0,0 +1,249 @@
+import pytest
+
+from zeep.exceptions import TransportError
+
+from ffiec_data_connect import credentials
+
+"""Tests for the WebserviceCredentials class that do not require access to the FFIEC webservice
+"""
+
+def test_credentials_from_init():
+    creds = credentials.WebserviceCredentials("user", "pass")
+    
+    assert(creds.username == "user")
+    assert(creds.password == "pass")
+    assert(creds.credential_source == credentials.CredentialType.SET_FROM_INIT)
+    
+    # credentials are stored in slots, so no per-instance __dict__ is allocated
+    assert(not hasattr(creds, "__dict__"))
+    
+    return
+
+def test_credentials_attributes_are_assignable():
+    creds = credentials.WebserviceCredentials("user", "pass")
+    creds.username = "other_user"
+    creds.password = "other_pass"
+    
+    assert(creds.username == "other_user")
+    assert(creds.password == "other_pass")
+    
+    return
+
+def test_with_backoff_retries_transient_errors(monkeypatch):
+    monkeypatch.setattr(credentials.time, "sleep", lambda seconds: None)
+    
+    calls = []
+    
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise credentials.requests.exceptions.ConnectionError("connection reset")
+        return True
+    
+    assert(credentials._with_backoff(flaky) == True)
+    assert(len(calls) == 3)
+    
+    return
+
+def test_with_backoff_does_not_retry_client_errors(monkeypatch):
+    monkeypatch.setattr(credentials.time, "sleep", lambda seconds: None)
+    
+    calls = []
+    
+    def unauthorized():
+        calls.append(1)
+        raise TransportError("Unauthorized", status_code=401)
+    
+    with pytest.raises(TransportError):
+        credentials._with_backoff(unauthorized)
+    
+    assert(len(calls) == 1)
+    
+    return
+
+def test_wsse_token_is_cached_until_credentials_change():
+    creds = credentials.WebserviceCredentials("user", "pass")
+    
+    wsse = creds._get_wsse()
+    assert(creds._get_wsse() is wsse)
+    
+    creds.password = "new_pass"
+    new_wsse = creds._get_wsse()
+    assert(new_wsse is not wsse)
+    assert(new_wsse.password == "new_pass")
+    
+    return
+
+def test_credentials_from_env(monkeypatch):
+    monkeypatch.setenv("FFIEC_USERNAME", "env_user")
+    monkeypatch.setenv("FFIEC_PASSWORD", "env_pass")
+    
+    creds = credentials.WebserviceCredentials()
+    assert(creds.username == "env_user")
+    assert(creds.credential_source == credentials.CredentialType.SET_FROM_ENV)
+    
+    # credentials passed in take precedence over the environment
+    creds = credentials.WebserviceCredentials("user", "pass")
+    assert(creds.username == "user")
+    assert(creds.credential_source == credentials.CredentialType.SET_FROM_INIT)
+    
+    return
+
+def test_credentials_missing(monkeypatch):
+    monkeypatch.delenv("FFIEC_USERNAME", raising=False)
+    monkeypatch.delenv("FFIEC_PASSWORD", raising=False)
+    
+    with pytest.raises(ValueError):
+        credentials.WebserviceCredentials()
+    
+    return
+
+def test_credentials_str():
+    creds = credentials.WebserviceCredentials("user", "pass")
+    
+    assert(str(creds) == "Credentials set from class initialization with username: user")
+    assert(repr(creds) == str(creds))
+    
+    return
+
+def test_transport_wraps_session():
+    creds = credentials.WebserviceCredentials("user", "pass")
+    session = credentials.requests.Session()
+    
+    transport = creds._get_transport(session)
+    assert(transport.session is session)
+    
+    # a keep-alive pool for the FFIEC host is mounted on the session
+    adapter = session.get_adapter(credentials.constants.WebserviceConstants.base_url)
+    assert(adapter is session.adapters[credentials.constants.WebserviceConstants.host_url])
+    
+    return
+
+def test_credentials_from_env_is_shared(monkeypatch):
+    monkeypatch.setenv("FFIEC_USERNAME", "env_user")
+    monkeypatch.setenv("FFIEC_PASSWORD", "env_pass")
+    credentials.WebserviceCredentials.from_env.cache_clear()
+    
+    creds = credentials.WebserviceCredentials.from_env()
+    assert(creds.username == "env_user")
+    assert(credentials.WebserviceCredentials.from_env() is creds)
+    
+    # clearing the cache creates a fresh instance from the current environment
+    monkeypatch.setenv("FFIEC_USERNAME", "other_env_user")
+    credentials.WebserviceCredentials.from_env.cache_clear()
+    
+    new_creds = credentials.WebserviceCredentials.from_env()
+    assert(new_creds is not creds)
+    assert(new_creds.username == "other_env_user")
+    assert(creds.username == "env_user")
+    
+    credentials.WebserviceCredentials.from_env.cache_clear()
+    
+    return
+
+def test_credentials_equality():
+    creds1 = credentials.WebserviceCredentials("user", "pass")
+    creds2 = credentials.WebserviceCredentials("user", "pass")
+    creds3 = credentials.WebserviceCredentials("user", "other_pass")
+    
+    assert(creds1 == creds2)
+    assert(hash(creds1) == hash(creds2))
+    assert(creds1 != creds3)
+    assert(len({creds1, creds2, creds3}) == 2)
+    
+    return
+
+def test_auth_circuit_opens_after_repeated_failures():
+    username = "circuit_test_user"
+    
+    for _ in range(credentials._AUTH_FAILURE_LIMIT - 1):
+        credentials._record_auth_failure(username)
+        credentials._check_auth_circuit(username)
+    
+    credentials._record_auth_failure(username)
+    
+    with pytest.raises(ValueError):
+        credentials._check_auth_circuit(username)
+    
+    credentials._AUTH_FAILURES.pop(username)
+    credentials._check_auth_circuit(username)
+    
+    return
+
+def test_get_client_is_shared_by_equal_credentials():
+    session = credentials.requests.Session()
+    session._ffiec_clients = {("user", "pass"): "cached client"}
+    
+    assert(credentials.WebserviceCredentials("user", "pass").get_client(session) == "cached client")
+    
+    return
+
+def test_get_client_follows_changed_credentials(monkeypatch):
+    
+    class FakeClient:
+        def __init__(self, wsdl, wsse, transport, settings):
+            self.wsse = wsse
+    
+    monkeypatch.setattr("zeep.Client", FakeClient)
+    
+    creds = credentials.WebserviceCredentials("user", "pass")
+    session = credentials.requests.Session()
+    
+    soap_client = creds.get_client(session)
+    creds.password = "new_pass"
+    new_client = creds.get_client(session)
+    
+    # a changed password gets its own client, and the client for the old password can still be found
+    assert(new_client is not soap_client)
+    assert(new_client.wsse.password == "new_pass")
+    assert(credentials.WebserviceCredentials("user", "pass").get_client(session) is soap_client)
+    assert(len(session._ffiec_clients) == 2)
+    
+    return
+
+def test_get_client_does_not_keep_sessions_alive(monkeypatch):
+    import gc
+    import weakref
+    
+    class FakeClient:
+        def __init__(self, wsdl, wsse, transport, settings):
+            self.transport = transport
+    
+    monkeypatch.setattr("zeep.Client", FakeClient)
+    
+    creds = credentials.WebserviceCredentials("user", "pass")
+    session = credentials.requests.Session()
+    
+    soap_client = creds.get_client(session)
+    assert(creds.get_client(session) is soap_client)
+    assert(soap_client.transport.session is session)
+    
+    session_ref = weakref.ref(session)
+    del session, soap_client
+    gc.collect()
+    
+    # the client is released together with its session
+    assert(session_ref() is None)
+    
+    return
+
+def test_credentials_server_errors_are_not_reported_as_invalid(monkeypatch, capsys):
+    monkeypatch.setattr(credentials.time, "sleep", lambda seconds: None)
+    
+    class FakeService:
+        def TestUserAccess(self):
+            raise TransportError("Service Unavailable", status_code=503)
+    
+    class FakeClient:
+        service = FakeService()
+    
+    creds = credentials.WebserviceCredentials("server_error_user", "pass")
+    monkeypatch.setattr(credentials.WebserviceCredentials, "get_client", lambda self, session: FakeClient())
+    
+    with pytest.raises(TransportError):
+        creds.test_credentials(credentials.requests.Session())
+    
+    assert("Credentials are invalid" not in capsys.readouterr().out)
+    assert("server_error_user" not in credentials._AUTH_FAILURES)
+    
+    return
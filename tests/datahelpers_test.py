@@ -0,0 +1,61 @@
+import pytest
+
+from ffiec_data_connect import datahelpers
+
+"""Tests for the normalization of results returned by the FFIEC webservice
+"""
+
+def test_normalize_output_from_reporter_panel():
+    row = {
+        "ID_RSSD": 37,
+        "FDICCertNumber": 0,
+        "OCCChartNumber": 1234,
+        "OTSDockNumber": 0,
+        "PrimaryABARoutNumber": 21000021,
+        "Name": " BANK OF TEST ",
+        "State": "NY ",
+        "City": " NEW YORK",
+        "Address": "1 MAIN ST",
+        "Zip": 501,
+        "FilingType": "051",
+        "HasFiledForReportingPeriod": True,
+    }
+    
+    result = datahelpers._normalize_output_from_reporter_panel(row)
+    
+    assert(result["id_rssd"] == "37")
+    assert(result["fdic_cert_number"] is None)
+    assert(result["occ_chart_number"] == "1234")
+    assert(result["ots_dock_number"] is None)
+    assert(result["primary_aba_rout_number"] == "21000021")
+    assert(result["name"] == "BANK OF TEST")
+    assert(result["state"] == "NY")
+    assert(result["city"] == "NEW YORK")
+    assert(result["address"] == "1 MAIN ST")
+    assert(result["zip"] == "00501")
+    assert(result["filing_type"] == "051")
+    assert(result["has_filed_for_reporting_period"] == True)
+    
+    return
+
+def test_normalize_output_from_reporter_panel_missing_fields():
+    result = datahelpers._normalize_output_from_reporter_panel({"ID_RSSD": 37, "HasFiledForReportingPeriod": 1})
+    
+    assert(result["id_rssd"] == "37")
+    assert(result["state"] is None)
+    assert(result["zip"] is None)
+    assert(result["has_filed_for_reporting_period"] is None)
+    
+    return
+
+def test_normalize_output_from_reporter_panel_tuple():
+    row = {"ID_RSSD": 37, "Name": " BANK OF TEST ", "Zip": 501, "HasFiledForReportingPeriod": False}
+    
+    result = datahelpers._normalize_output_from_reporter_panel_tuple(row)
+    
+    assert(len(result) == len(datahelpers._REPORTER_PANEL_COLUMNS))
+    assert(dict(zip(datahelpers._REPORTER_PANEL_COLUMNS, result)) == datahelpers._normalize_output_from_reporter_panel(row))
+    assert(result[0] == "37")
+    assert(result[-1] == False)
+    
+    return
@@ -0,0 +1,214 @@
+from datetime import datetime
+from types import SimpleNamespace
+import pytest
+import pandas as pd
+
+from ffiec_data_connect import methods as m
+
+"""Tests for the internal helper functions of the methods module that do not require access to the FFIEC webservice
+"""
+
+# credentials passed to the collect_* methods when the webservice client is replaced by fake_client
+CREDS = m.credentials.WebserviceCredentials("user", "password")
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    """Replaces the webservice client with a fake whose service methods are passed as keyword arguments
+    
+    e.g. fake_client(RetrieveReportingPeriods=lambda dataSeries: ["2022-03-31"])
+    """
+    
+    def install(**service_methods):
+        client = SimpleNamespace(service=SimpleNamespace(**service_methods))
+        monkeypatch.setattr(m, "_client_factory", lambda session, creds: client)
+        return client
+    
+    return install
+
+def test_parse_ffiec_datetime():
+    assert(m._parse_ffiec_datetime("3/31/2020 4:05:12 PM") == datetime(2020, 3, 31, 16, 5, 12))
+    assert(m._parse_ffiec_datetime("12/1/2021 9:00:00 AM") == datetime(2021, 12, 1, 9, 0, 0))
+    assert(m._parse_ffiec_datetime("6/30/2022 12:30:00 AM") == datetime(2022, 6, 30, 0, 30, 0))
+    assert(m._parse_ffiec_datetime("6/30/2022 12:30:00 PM") == datetime(2022, 6, 30, 12, 30, 0))
+    
+    return
+
+def test_is_valid_date_or_quarter():
+    assert(m._is_valid_date_or_quarter("1Q2020"))
+    assert(m._is_valid_date_or_quarter("4q2021"))
+    assert(m._is_valid_date_or_quarter("20200331"))
+    assert(m._is_valid_date_or_quarter("2020-03-31"))
+    assert(m._is_valid_date_or_quarter("3/31/2020"))
+    assert(m._is_valid_date_or_quarter(datetime(2020, 6, 30)))
+    
+    assert(not m._is_valid_date_or_quarter("5Q2020"))
+    assert(not m._is_valid_date_or_quarter("2020/03/31"))
+    assert(not m._is_valid_date_or_quarter(20200331))
+    assert(not m._is_valid_date_or_quarter("1q-2020"))
+    assert(not m._is_valid_date_or_quarter("2020033"))
+    assert(not m._is_valid_date_or_quarter(""))
+    assert(not m._is_valid_date_or_quarter(datetime(2020, 6, 29)))
+    
+    return
+
+def test_convert_quarter_to_date():
+    assert(m._convert_quarter_to_date("1Q2020") == datetime(2020, 3, 31))
+    assert(m._convert_quarter_to_date("3q2021") == datetime(2021, 9, 30))
+    
+    return
+
+def test_convert_any_date_to_ffiec_format():
+    assert(m._convert_any_date_to_ffiec_format("2020-03-31") == "3/31/2020")
+    assert(m._convert_any_date_to_ffiec_format("20200630") == "6/30/2020")
+    assert(m._convert_any_date_to_ffiec_format("09/30/2021") == "9/30/2021")
+    assert(m._convert_any_date_to_ffiec_format(datetime(2021, 12, 31)) == "12/31/2021")
+    
+    with pytest.raises(ValueError):
+        m._convert_any_date_to_ffiec_format("2020-02-30")
+    
+    with pytest.raises(ValueError):
+        m._convert_any_date_to_ffiec_format("2020.03.31")
+    
+    with pytest.raises(ValueError):
+        m._convert_any_date_to_ffiec_format("2020033")
+    
+    return
+
+def test_collect_reporting_periods_date_formats(fake_client):
+    fake_client(RetrieveReportingPeriods=lambda dataSeries: ["2022-03-31", "2021-12-31"])
+    
+    session = m.requests.Session()
+    
+    assert(m.collect_reporting_periods(session, CREDS) == ["2022-03-31", "2021-12-31"])
+    assert(m.collect_reporting_periods(session, CREDS, date_output_format="string_yyyymmdd") == ["20220331", "20211231"])
+    assert(m.collect_reporting_periods(session, CREDS, date_output_format="python_format") == [datetime(2022, 3, 31), datetime(2021, 12, 31)])
+    
+    return
+
+def test_return_ffiec_reporting_date():
+    assert(m._return_ffiec_reporting_date("2Q2020") == "6/30/2020")
+    assert(m._return_ffiec_reporting_date("1q2020") == "3/31/2020")
+    assert(m._return_ffiec_reporting_date("2020-09-30") == "9/30/2020")
+    assert(m._return_ffiec_reporting_date("03/31/2021") == "3/31/2021")
+    assert(m._return_ffiec_reporting_date("20211231") == "12/31/2021")
+    assert(m._return_ffiec_reporting_date(datetime(2021, 12, 31)) == "12/31/2021")
+    
+    with pytest.raises(ValueError):
+        m._return_ffiec_reporting_date("2020-09-29")
+    
+    # malformed and too-short strings are reported as invalid dates, not as index errors
+    for invalid in ("1Q20", "1", ""):
+        with pytest.raises(ValueError):
+            m._return_ffiec_reporting_date(invalid)
+    
+    return
+
+def test_rows_to_columns():
+    rows = [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
+    
+    assert(m._rows_to_columns(rows, ("a", "b")) == {"a": [1, 2], "b": ["x", "y"]})
+    assert(m._rows_to_columns([], ("a", "b")) == {"a": [], "b": []})
+    
+    return
+
+def test_validate_call_args():
+    creds = m.credentials.WebserviceCredentials("user", "password")
+    session = m.requests.Session()
+    
+    assert(m._validate_call_args("list", creds, session))
+    assert(m._validate_call_args("pandas", creds, session, "python_format"))
+    
+    with pytest.raises(ValueError):
+        m._validate_call_args("csv", creds, session)
+    
+    with pytest.raises(ValueError):
+        m._validate_call_args("list", creds, session, "iso")
+    
+    with pytest.raises(ValueError):
+        m._validate_call_args("list", "user", session)
+    
+    with pytest.raises(ValueError):
+        m._validate_call_args("list", creds, None)
+    
+    return
+
+def test_collect_reporting_periods_pandas_output(fake_client):
+    fake_client(RetrieveReportingPeriods=lambda dataSeries: ["2022-03-31", "2021-12-31"])
+    
+    df = m.collect_reporting_periods(m.requests.Session(), CREDS, output_type="pandas")
+    
+    assert(list(df.columns) == ["reporting_period"])
+    assert(list(df["reporting_period"]) == ["2022-03-31", "2021-12-31"])
+    
+    return
+
+def test_xbrl_output_builders_cover_output_types():
+    assert(set(m._XBRL_OUTPUT_BUILDERS) == m._VALID_OUTPUT_TYPES)
+    
+    rows = [{"mdrm": "RCON2170", "rssd": "37", "quarter": "3/31/2020", "int_data": 1, "float_data": None, "bool_data": None, "str_data": None, "data_type": "int"}]
+    
+    assert(m._XBRL_OUTPUT_BUILDERS["list"](rows) is rows)
+    assert(list(m._XBRL_OUTPUT_BUILDERS["pandas"](rows)["mdrm"]) == ["RCON2170"])
+    
+    return
+
+def test_collect_filers_submission_date_time(fake_client):
+    
+    def retrieve_filers_submission_date_time(dataSeries, lastUpdateDateTime, reportingPeriodEndDate):
+        assert(lastUpdateDateTime == "4/1/2022")
+        assert(reportingPeriodEndDate == "3/31/2022")
+        return [{"ID_RSSD": 37, "DateTime": "4/15/2022 1:02:03 PM"}, {"ID_RSSD": 242, "DateTime": "4/16/2022 9:00:00 AM"}]
+    
+    fake_client(RetrieveFilersSubmissionDateTime=retrieve_filers_submission_date_time)
+    
+    session = m.requests.Session()
+    
+    ret = m.collect_filers_submission_date_time(session, CREDS, "2022-04-01", "1Q2022")
+    assert(ret == [{"rssd": 37, "datetime": "4/15/2022 1:02:03 PM"}, {"rssd": 242, "datetime": "4/16/2022 9:00:00 AM"}])
+    
+    ret = m.collect_filers_submission_date_time(session, CREDS, "2022-04-01", "1Q2022", date_output_format="python_format")
+    assert(ret[0]["datetime"] == datetime(2022, 4, 15, 13, 2, 3, tzinfo=m.ZoneInfo("US/Eastern")))
+    
+    df = m.collect_filers_submission_date_time(session, CREDS, "2022-04-01", "1Q2022", output_type="pandas")
+    assert(list(df.columns) == ["rssd", "datetime"])
+    assert(list(df["rssd"]) == [37, 242])
+    
+    return
+
+def test_collect_filers_submission_date_time_pandas_matches_list(fake_client):
+    # includes a time in the repeated hour and a time in the skipped hour of daylight saving time
+    filers = [{"ID_RSSD": 37, "DateTime": "4/15/2022 1:02:03 PM"}, {"ID_RSSD": 242, "DateTime": "11/6/2022 1:30:00 AM"}, {"ID_RSSD": 480, "DateTime": "3/13/2022 2:30:00 AM"}]
+    fake_client(RetrieveFilersSubmissionDateTime=lambda dataSeries, lastUpdateDateTime, reportingPeriodEndDate: filers)
+    
+    session = m.requests.Session()
+    
+    ret = m.collect_filers_submission_date_time(session, CREDS, "2022-04-01", "1Q2022", date_output_format="python_format")
+    df = m.collect_filers_submission_date_time(session, CREDS, "2022-04-01", "1Q2022", output_type="pandas", date_output_format="python_format")
+    
+    # compare as pandas timestamps, since python does not consider ambiguous datetimes in different tzinfo objects equal
+    assert((df["datetime"] == pd.DataFrame(ret)["datetime"]).all())
+    
+    return
+
+def test_collect_filers_on_reporting_period_pandas_output(fake_client):
+    reporters = [{"ID_RSSD": 37, "Name": " BANK OF TEST ", "Zip": 501, "HasFiledForReportingPeriod": True}]
+    fake_client(RetrievePanelOfReporters=lambda dataSeries, reportingPeriodEndDate: reporters)
+    
+    df = m.collect_filers_on_reporting_period(m.requests.Session(), CREDS, "2022-03-31", output_type="pandas")
+    
+    assert(tuple(df.columns) == m.datahelpers._REPORTER_PANEL_COLUMNS)
+    assert(df.loc[0, "name"] == "BANK OF TEST")
+    assert(df.loc[0, "zip"] == "00501")
+    
+    return
+
+def test_collect_filers_since_date_returns_response_for_list_output(fake_client):
+    rssd_ids = [37, 242]
+    fake_client(RetrieveFilersSinceDate=lambda dataSeries, lastUpdateDateTime, reportingPeriodEndDate: rssd_ids)
+    
+    session = m.requests.Session()
+    
+    assert(m.collect_filers_since_date(session, CREDS, "1Q2022", "2022-04-01") is rssd_ids)
+    assert(list(m.collect_filers_since_date(session, CREDS, "1Q2022", "2022-04-01", output_type="pandas")["rssd_id"]) == rssd_ids)
+    
+    return
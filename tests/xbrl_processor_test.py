@@ -0,0 +1,43 @@
+from datetime import datetime
+import pytest
+
+from ffiec_data_connect import xbrl_processor
+
+"""Tests for the processing of XBRL data returned by the FFIEC webservice
+"""
+
+test_xbrl = b'''<?xml version="1.0" encoding="utf-8"?>
+<xbrl xmlns:cc="http://www.ffiec.gov/xbrl/call/concepts" xmlns:uc="http://www.cdr.ffiec.gov/xbrl/ubpr/concepts">
+<cc:RCON2170 contextRef="CI_37_2020-03-31" unitRef="USD" decimals="0">123456000</cc:RCON2170>
+<cc:RCONA517 contextRef="CI_37_2020-03-31" unitRef="PURE" decimals="2">0.12</cc:RCONA517>
+<cc:RCON9999 contextRef="CI_37_2020-03-31">true</cc:RCON9999>
+<uc:UBPRTEXT contextRef="CI_37_2020-03-31">TEST BANK</uc:UBPRTEXT>
+</xbrl>'''
+
+def test_process_xml():
+    results = xbrl_processor._process_xml(test_xbrl, "string_original")
+    
+    assert(len(results) == 4)
+    
+    assert(results[0] == {"mdrm": "RCON2170", "rssd": "37", "quarter": "3/31/2020", "int_data": 123456, "float_data": None, "bool_data": None, "str_data": None, "data_type": "int"})
+    assert(results[1]["float_data"] == 0.12)
+    assert(results[1]["data_type"] == "float")
+    assert(results[2]["bool_data"] == True)
+    assert(results[2]["data_type"] == "bool")
+    assert(results[3]["mdrm"] == "UBPRTEXT")
+    assert(results[3]["str_data"] == "TEST BANK")
+    
+    return
+
+def test_process_xml_date_formats():
+    assert(xbrl_processor._process_xml(test_xbrl, "string_yyyymmdd")[0]["quarter"] == "20200331")
+    assert(xbrl_processor._process_xml(test_xbrl, "python_format")[0]["quarter"] == datetime(2020, 3, 31))
+    
+    return
+
+def test_process_xml_rows_match_columns():
+    results = xbrl_processor._process_xml(test_xbrl, "string_original")
+    
+    assert(all(tuple(row.keys()) == xbrl_processor._XBRL_COLUMNS for row in results))
+    
+    return